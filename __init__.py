@@ -12,6 +12,7 @@ from .src.better_bound_box.utils import (
     scale_objects_to_depth,
     scale_objects_to_max
 )
+from .src.better_bound_box.bound_math import shutdown_executor
 
 # ------------------------------------------------------------------------
 #   One-file add-on to test the Better Object Bound Box
@@ -122,5 +123,7 @@ def unregister():
     bpy.utils.unregister_class(BOBB_PT_TestPanel)
     bpy.utils.unregister_class(BOBB_PT_TestOperator)
 
+    shutdown_executor()
+
 if __name__ == "__main__":
     register()
\ No newline at end of file
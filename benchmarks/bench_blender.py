@@ -0,0 +1,137 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2023 Rodrigo Gama
+
+'''Blender benchmark suite of the BoundBox methods and utils functions
+
+Run it inside Blender in background mode, the arguments of the suite
+are passed after ``--``:
+
+    blender --background --factory-startup --python benchmarks/bench_blender.py -- [--update-baselines]
+
+'''
+
+import os
+import sys
+
+import bpy #type:ignore
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import common
+
+sys.path.insert(0, common.SRC_DIR)
+
+from better_bound_box import BoundBox, instrumentation
+from better_bound_box import utils
+from better_bound_box.bound_box import BoundVectors
+
+SUITE = "blender"
+
+
+def build_scene(scene : dict) -> list[bpy.types.Object]:
+    '''Clear the current scene and generate the objects of the given scene'''
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+    rng = common.scene_rng(scene)
+    meshes = []
+    for index in range(common.unique_mesh_count(scene)):
+        mesh = bpy.data.meshes.new(f"{scene['name']}_mesh_{index}")
+        mesh.from_pydata(common.random_points(rng, scene["vertices"]), [], [])
+        mesh.update()
+        meshes.append(mesh)
+
+    objs = []
+    for index in range(scene["objects"]):
+        ob = bpy.data.objects.new(f"{scene['name']}_{index}", meshes[index % len(meshes)])
+        ob.location, ob.rotation_euler = common.random_transform(rng, scene["rotation"])
+        bpy.context.scene.collection.objects.link(ob)
+        objs.append(ob)
+
+    bpy.context.view_layer.update()
+    return objs
+
+
+def cases(context, objs : list[bpy.types.Object], workers : int) -> dict:
+    '''Get the benchmark cases, each one is a function without arguments'''
+
+    bound_box = BoundBox(context, objs)
+
+    benchmark_cases = {
+        "BoundBox.__init__": lambda: BoundBox(context, objs),
+        "BoundVectors.update": bound_box.bv.update,
+        "BoundBox.get_center": bound_box.get_center,
+        "BoundBox.get_bottom_center": bound_box.get_bottom_center,
+        "BoundBox.get_hight_vectors": bound_box.get_hight_vectors,
+        "BoundBox.get_width_vectors": bound_box.get_width_vectors,
+        "BoundBox.get_depth_vectors": bound_box.get_depth_vectors,
+        "BoundBox.get_real_height": bound_box.get_real_height,
+        "BoundBox.get_real_width": bound_box.get_real_width,
+        "BoundBox.get_real_depth": bound_box.get_real_depth,
+        "BoundBox.get_largest_dimension": bound_box.get_largest_dimension,
+        "BoundBox.get_mean_dimension": bound_box.get_mean_dimension,
+        "BoundBox.set_origin": lambda: bound_box.set_origin(context, location=bound_box.get_center()),
+        "BoundBox.set_location": lambda: bound_box.set_location(context, location=(0, 0, 0)),
+        "BoundBox.scale_to_height": lambda: bound_box.scale_to_height(context, 2),
+        "BoundBox.scale_to_width": lambda: bound_box.scale_to_width(context, 2),
+        "BoundBox.scale_to_depth": lambda: bound_box.scale_to_depth(context, 2),
+        "utils.init_bound_box": lambda: utils.init_bound_box(context, objs),
+        "utils.center_objects_by_center": lambda: utils.center_objects_by_center(context, objs),
+        "utils.center_objects_by_bottom_center": lambda: utils.center_objects_by_bottom_center(context, objs),
+        "utils.scale_objects_to_height": lambda: utils.scale_objects_to_height(context, objs, 2),
+        "utils.scale_objects_to_width": lambda: utils.scale_objects_to_width(context, objs, 2),
+        "utils.scale_objects_to_depth": lambda: utils.scale_objects_to_depth(context, objs, 2),
+        "utils.scale_objects_to_max": lambda: utils.scale_objects_to_max(context, objs, 1, 1, 1),
+    }
+
+    # The thread pool is disabled by default, so it has its own case
+    if workers > 1:
+        parallel_bv = BoundVectors(objs, workers=workers, parallel_threshold=0)
+        benchmark_cases[f"BoundVectors.update[workers={workers}]"] = parallel_bv.update
+
+    return benchmark_cases
+
+
+def run(args) -> dict[str, dict]:
+
+    results = {}
+
+    for scene in common.selected_scenes(args):
+        vertices = scene["objects"] * scene["vertices"]
+        names = list(common.selected_cases(args, cases(bpy.context, build_scene(scene), args.workers)))
+
+        for name in names:
+            # Every case runs on a new scene, the cases that move, scale or set the
+            # origin of the objects would change the scene of the next ones (ex: the
+            # origin of linked duplicates is set once per object on the same mesh)
+            func = cases(bpy.context, build_scene(scene), args.workers)[name]
+
+            # The getters only read the stored bound vectors, they don't process any vertex
+            processed = 0 if name.startswith("BoundBox.get_") else vertices
+
+            try:
+                result = {"vertices": processed, **common.measure(func, args.repeat)}
+
+                # One more run with the instrumentation enabled, to get where the time goes
+                stats = instrumentation.add_sink(instrumentation.StatsSink())
+                try:
+                    func()
+                finally:
+                    instrumentation.remove_sink(stats)
+
+            # The bpy.ops calls fail when their poll needs a context that isn't
+            # available, ex: a window in some background mode builds
+            except RuntimeError as error:
+                results[f"{name}/{scene['name']}"] = {"vertices": processed, "skipped": str(error).strip()}
+                continue
+
+            result["phases"] = {phase: phase_stats["total"] for phase, phase_stats in stats.phases.items()}
+            results[f"{name}/{scene['name']}"] = result
+
+    return results
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    args = common.parse_args(__doc__, argv)
+    sys.exit(common.report(SUITE, run(args), args))
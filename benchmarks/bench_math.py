@@ -0,0 +1,101 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2023 Rodrigo Gama
+
+'''bpy-free benchmark suite of the bound box math
+
+Run it with any Python 3.11 interpreter:
+
+    python benchmarks/bench_math.py [--update-baselines]
+
+'''
+
+import functools
+import math
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import common
+
+bound_math = common.load_module(
+    "bound_math", os.path.join(common.SRC_DIR, "better_bound_box", "bound_math.py"))
+
+SUITE = "math"
+
+
+def euler_matrix(rotation : tuple[float, float, float]) -> list[list[float]]:
+    '''Get the 3x3 rotation matrix of a XYZ euler rotation'''
+
+    cx, cy, cz = (math.cos(angle) for angle in rotation)
+    sx, sy, sz = (math.sin(angle) for angle in rotation)
+
+    return [
+        [cy * cz, sx * sy * cz - cx * sz, cx * sy * cz + sx * sz],
+        [cy * sz, sx * sy * sz + cx * cz, cx * sy * sz - sx * cz],
+        [-sy, sx * cy, cx * cy],
+    ]
+
+
+def build_scene(scene : dict) -> list[tuple[np.ndarray, np.ndarray]]:
+    '''Generate the (coords, world matrix) buffers of every object of the scene,
+    linked duplicates share the same coords array'''
+
+    rng = common.scene_rng(scene)
+    meshes = [
+        np.array(common.random_points(rng, scene["vertices"]), dtype=np.float32)
+        for _ in range(common.unique_mesh_count(scene))
+    ]
+
+    buffers = []
+    for index in range(scene["objects"]):
+        location, rotation = common.random_transform(rng, scene["rotation"])
+
+        matrix = np.identity(4)
+        matrix[:3, :3] = euler_matrix(rotation)
+        matrix[:3, 3] = location
+
+        buffers.append((meshes[index % len(meshes)], matrix))
+
+    return buffers
+
+
+def world_points(buffers : list[tuple[np.ndarray, np.ndarray]]) -> list[list[tuple[float, float, float]]]:
+    '''Get the world space points of every object as python tuples'''
+
+    return [
+        [tuple(point) for point in (coords @ matrix[:3, :3].T + matrix[:3, 3]).tolist()]
+        for coords, matrix in buffers
+    ]
+
+
+def run(args) -> dict[str, dict]:
+
+    results = {}
+
+    for scene in common.selected_scenes(args):
+        buffers = build_scene(scene)
+        objects = world_points(buffers)
+        vertices = scene["objects"] * scene["vertices"]
+
+        def reduce_objects():
+            extremes = []
+            for points in objects:
+                extremes = bound_math.update_extreme_vectors(extremes, points)
+
+        cases = {f"update_extreme_vectors/{scene['name']}": reduce_objects}
+        for workers in sorted({1, args.workers}):
+            cases[f"parallel_extreme_vectors[workers={workers}]/{scene['name']}"] = functools.partial(
+                bound_math.parallel_extreme_vectors, buffers, workers)
+
+        for case, func in common.selected_cases(args, cases).items():
+            results[case] = {"vertices": vertices, **common.measure(func, args.repeat)}
+
+    return results
+
+
+if __name__ == "__main__":
+    args = common.parse_args(__doc__)
+    sys.exit(common.report(SUITE, run(args), args))
@@ -0,0 +1,216 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2023 Rodrigo Gama
+
+'''Shared helpers of the benchmark suites
+
+This module doesn't import bpy, it's used both by the bpy-free suite
+(bench_math.py) and by the Blender suite (bench_blender.py).
+'''
+
+import argparse
+import importlib.util
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import timeit
+import tracemalloc
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCHMARKS_DIR), "src")
+BASELINES_PATH = os.path.join(BENCHMARKS_DIR, "baselines.json")
+
+SEED = 1902
+
+# Peak memory growth always allowed, so tiny peaks don't fail on allocator noise
+MEMORY_SLACK = 64 * 1024
+
+# Synthetic scenes, each one is generated with the given number of objects,
+# number of vertices per object, ratio of objects that are linked duplicates
+# (sharing the mesh data of another object) and random rotations or not
+
+SCENES = [
+    {"name": "single_small", "objects": 1, "vertices": 1_000, "linked_ratio": 0.0, "rotation": False},
+    {"name": "single_large", "objects": 1, "vertices": 100_000, "linked_ratio": 0.0, "rotation": False},
+    {"name": "single_large_rotated", "objects": 1, "vertices": 100_000, "linked_ratio": 0.0, "rotation": True},
+    {"name": "group_small", "objects": 100, "vertices": 500, "linked_ratio": 0.0, "rotation": True},
+    {"name": "group_linked", "objects": 100, "vertices": 500, "linked_ratio": 0.9, "rotation": True},
+    {"name": "group_large", "objects": 2_000, "vertices": 100, "linked_ratio": 0.5, "rotation": True},
+]
+
+
+def load_module(name : str, path : str):
+    '''Load a module from its file path without importing its package,
+    used to load the bpy-free modules of better_bound_box outside of Blender'''
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def scene_rng(scene : dict) -> random.Random:
+    '''Get a random generator seeded by the scene name, so every run
+    generates the same scene'''
+
+    return random.Random(f"{SEED}-{scene['name']}")
+
+
+def random_points(rng : random.Random, count : int, size : float = 1.0) -> list[tuple[float, float, float]]:
+    '''Generate a point cloud inside a cube of the given size'''
+
+    half = size / 2
+    return [
+        (rng.uniform(-half, half), rng.uniform(-half, half), rng.uniform(-half, half))
+        for _ in range(count)
+    ]
+
+
+def random_transform(rng : random.Random, rotation : bool) -> tuple[tuple[float, float, float], tuple[float, float, float]]:
+    '''Generate a random location and euler rotation (radians)'''
+
+    location = (rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10))
+    if not rotation:
+        return location, (0.0, 0.0, 0.0)
+
+    return location, (rng.uniform(0, math.tau), rng.uniform(0, math.tau), rng.uniform(0, math.tau))
+
+
+def unique_mesh_count(scene : dict) -> int:
+    '''Get the number of objects that own their mesh data, the other ones
+    are linked duplicates'''
+
+    return max(1, round(scene["objects"] * (1 - scene["linked_ratio"])))
+
+
+def measure(func, repeat : int) -> dict[str, float]:
+    '''Get the median wall time in seconds of one call of the function and
+    the peak memory in bytes allocated by Python during one call
+
+    Each one of the *repeat* samples runs the function in a loop long enough
+    to be timed reliably (see :meth:`timeit.Timer.autorange`)'''
+
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    samples = [seconds / loops for seconds in timer.repeat(repeat, loops)]
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": statistics.median(samples), "loops": loops, "peak_memory": peak}
+
+
+def parse_args(description : str, argv : list[str] | None = None) -> argparse.Namespace:
+    '''Parse the command line arguments of a benchmark suite'''
+
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--repeat", type=int, default=7, help="number of timed samples of each case")
+    parser.add_argument("--scenes", nargs="*", help="names of the scenes to run, default to all")
+    parser.add_argument("--cases", nargs="*", help="prefixes of the names of the cases to run, default to all")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of threads of the parallel cases, default to the number of cpus")
+    parser.add_argument("--baselines", default=BASELINES_PATH, help="path of the baselines json file")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed throughput drop and peak memory growth, as a ratio of the baseline")
+    parser.add_argument("--update-baselines", action="store_true", help="store the results as the new baselines")
+    parser.add_argument("--output", help="path of a json file to write the results to")
+
+    return parser.parse_args(argv)
+
+
+def selected_scenes(args : argparse.Namespace) -> list[dict]:
+    '''Get the scenes selected in the command line'''
+
+    if not args.scenes:
+        return SCENES
+    return [scene for scene in SCENES if scene["name"] in args.scenes]
+
+
+def selected_cases(args : argparse.Namespace, cases : dict) -> dict:
+    '''Get the cases selected in the command line'''
+
+    if not args.cases:
+        return cases
+    return {name: case for name, case in cases.items() if name.startswith(tuple(args.cases))}
+
+
+def report(suite : str, results : dict[str, dict], args : argparse.Namespace) -> int:
+    '''Print the results, compare them against the stored baselines and
+    return the exit code of the suite (1 if there is any regression)
+
+    *results* - dict of case name to a dict with ``vertices``, ``seconds``
+    and ``peak_memory``, or with ``vertices`` and ``skipped`` (the reason) if
+    the case couldn't run
+
+    Only the cases that process vertices (``vertices`` greater than 0) have a
+    throughput, so only them are compared and stored as baselines.
+
+    '''
+
+    baselines = {}
+    if os.path.exists(args.baselines):
+        with open(args.baselines, encoding="utf-8") as file:
+            baselines = json.load(file)
+    suite_baselines = baselines.setdefault(suite, {})
+
+    regressions = []
+
+    for case, result in results.items():
+
+        if "skipped" in result:
+            print(f"{case:<60} skipped: {result['skipped'].splitlines()[0]}")
+            continue
+
+        if not result["vertices"]:
+            result["throughput"] = None
+            print(f"{case:<60} {result['seconds'] * 1e6:>10.2f} us {'-':>14} verts/s "
+                  f"{result['peak_memory'] / 1024:>10,.0f} KiB  not compared")
+            continue
+
+        result["throughput"] = result["vertices"] / result["seconds"]
+
+        status = "no baseline"
+        baseline = suite_baselines.get(case)
+        if baseline:
+            status = "ok"
+            if result["throughput"] < baseline["throughput"] * (1 - args.tolerance):
+                status = "SLOWER"
+            if result["peak_memory"] > baseline["peak_memory"] * (1 + args.tolerance) + MEMORY_SLACK:
+                status = "MORE MEMORY" if status == "ok" else status + ", MORE MEMORY"
+            if status != "ok":
+                regressions.append(case)
+
+        print(f"{case:<60} {result['seconds'] * 1000:>10.2f} ms "
+              f"{result['throughput']:>14,.0f} verts/s "
+              f"{result['peak_memory'] / 1024:>10,.0f} KiB  {status}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({suite: results}, file, indent=4)
+            file.write("\n")
+
+    if args.update_baselines:
+        for case, result in results.items():
+            if not result["vertices"] or "skipped" in result:
+                continue
+            suite_baselines[case] = {
+                "throughput": result["throughput"],
+                "peak_memory": result["peak_memory"],
+            }
+        with open(args.baselines, "w", encoding="utf-8") as file:
+            json.dump(baselines, file, indent=4, sort_keys=True)
+            file.write("\n")
+        print(f"Baselines stored in {args.baselines}")
+        return 0
+
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+        return 1
+
+    return 0
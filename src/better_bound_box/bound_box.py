@@ -12,8 +12,14 @@ import bpy #type:ignore
 import bmesh #type:ignore
 import mathutils #type:ignore
 
+import numpy as np
+
 import statistics
 
+from . import instrumentation
+from .bound_math import (
+    update_extreme_vectors,
+    parallel_extreme_vectors)
 from .debug_utils import (
     add_display_point, 
     add_bound_box_viewport)
@@ -28,10 +34,27 @@ class BoundVectors:
     min_vertex_x : list[float]
     min_vertex_y : list[float] 
     min_vertex_z : list[float] 
+
+    # Number of threads used to transform and reduce the vertices, and minimum
+    # number of mesh objects to use them. Smaller groups are processed serially,
+    # so they don't pay the thread pool overhead. The thread pool is disabled
+    # by default, set more workers to enable it
+    workers : int = 1
+    parallel_threshold : int = 64
     
-    def __init__(self, objs): 
+    def __init__(
+            self, 
+            objs, 
+            workers : int | None = None, 
+            parallel_threshold : int | None = None): 
         
         self.objs = objs    
+
+        if workers is not None:
+            self.workers = workers
+        if parallel_threshold is not None:
+            self.parallel_threshold = parallel_threshold
+
         self._get_objs_bound_vectors(objs)
     
     @staticmethod
@@ -39,21 +62,77 @@ class BoundVectors:
         '''Get all vertices of the objects'''
 
         total_verts = {}
+        mesh_verts = {}
 
-        for ob in objs:
+        # An object given more than once is only read and counted once
+        for ob in dict.fromkeys(objs):
             if not ob.type == "MESH":
                 continue
 
             me = ob.data
-            bm = bmesh.new()
-            bm.from_mesh(me)
 
-            total_verts[ob] = [[v.co[0], v.co[1], v.co[2]] for v in bm.verts]
+            # Linked duplicates share the same mesh, so its vertices are read once
+            verts = mesh_verts.get(me)
+            if verts is None:
+                instrumentation.count(instrumentation.CACHE_MISSES)
+                bm = bmesh.new()
+                bm.from_mesh(me)
 
-            bm.free()
+                verts = mesh_verts[me] = [[v.co[0], v.co[1], v.co[2]] for v in bm.verts]
+
+                bm.free()
+            else:
+                instrumentation.count(instrumentation.CACHE_HITS)
+
+            total_verts[ob] = verts
+
+            instrumentation.count(instrumentation.MESH_OBJECTS)
+            instrumentation.count(instrumentation.VERTICES, len(verts))
 
         return total_verts
 
+    @staticmethod
+    def _get_object_buffers(objs) -> list[tuple[np.ndarray, np.ndarray]]:
+        '''Get the coordinates and world matrix of the objects as numpy arrays,
+        it must run in the main thread because it reads from bpy'''
+
+        buffers = []
+        mesh_coords = {}
+
+        # An object given more than once is only read and counted once
+        for ob in dict.fromkeys(objs):
+            if not ob.type == "MESH":
+                continue
+
+            me = ob.data
+
+            # Linked duplicates share the same mesh, so its coordinates are read once
+            coords = mesh_coords.get(me)
+            if coords is None:
+                instrumentation.count(instrumentation.CACHE_MISSES)
+                coords = np.empty(len(me.vertices) * 3, dtype=np.float32)
+                me.vertices.foreach_get("co", coords)
+                coords = mesh_coords[me] = coords.reshape(-1, 3)
+            else:
+                instrumentation.count(instrumentation.CACHE_HITS)
+
+            instrumentation.count(instrumentation.MESH_OBJECTS)
+            instrumentation.count(instrumentation.VERTICES, len(coords))
+
+            if not len(coords):
+                continue
+
+            buffers.append((coords, np.array(ob.matrix_world, dtype=np.float64)))
+
+        return buffers
+
+    def _use_parallel(self, objs) -> bool:
+        '''Check if the objects are enough to use the parallel path'''
+
+        if self.workers <= 1:
+            return False
+        return sum(ob.type == "MESH" for ob in dict.fromkeys(objs)) >= self.parallel_threshold
+
     def _get_objs_bound_vectors(self, objs):
         '''Get all bound vectors of the objects'''
                 
@@ -65,44 +144,52 @@ class BoundVectors:
         self.min_vertex_y = []
         self.min_vertex_z = []
 
-        vertex_data: dict[bpy.types.Object, list[list[float]]] = self._get_object_vertices(objs)
-    
+        instrumentation.count(instrumentation.RESCANS)
+        instrumentation.count(instrumentation.OBJECTS, len(objs))
+
+        if self._use_parallel(objs):
+
+            with instrumentation.phase(instrumentation.EXTRACT):
+                buffers = self._get_object_buffers(objs)
+
+            with instrumentation.phase(instrumentation.TRANSFORM):
+                self._reduce_bound_vectors_parallel(buffers)
+
+            return
+
+        with instrumentation.phase(instrumentation.EXTRACT):
+            vertex_data: dict[bpy.types.Object, list[list[float]]] = self._get_object_vertices(objs)
+
+        with instrumentation.phase(instrumentation.TRANSFORM):
+            self._reduce_bound_vectors(vertex_data)
+
+    def _reduce_bound_vectors(self, vertex_data):
+        '''Transform the vertices to world space and keep the min and max vectors'''
+
+        extremes = []
+
         for ob in vertex_data:
             # Get the object's transformation matrix
             obj_matrix = ob.matrix_world
-            
-            for v in vertex_data[ob]:
-                # Apply the object's transformation to the vertex
-                transformed_vertex = obj_matrix @ mathutils.Vector(v)
-                
-                if not self.max_vertex_x:
-                    self.max_vertex_x = transformed_vertex
-                if not self.max_vertex_y:
-                    self.max_vertex_y = transformed_vertex
-                if not self.max_vertex_z:
-                    self.max_vertex_z = transformed_vertex
-                    
-                if not self.min_vertex_x:
-                    self.min_vertex_x = transformed_vertex
-                if not self.min_vertex_y:
-                    self.min_vertex_y = transformed_vertex
-                if not self.min_vertex_z:
-                    self.min_vertex_z = transformed_vertex
-                
-                if transformed_vertex[0] >= self.max_vertex_x[0]:
-                    self.max_vertex_x = transformed_vertex
-                if transformed_vertex[1] >= self.max_vertex_y[1]:
-                    self.max_vertex_y = transformed_vertex             
-                if transformed_vertex[2] >= self.max_vertex_z[2]:
-                    self.max_vertex_z = transformed_vertex  
-                                
-                if transformed_vertex[0] <= self.min_vertex_x[0]:
-                    self.min_vertex_x = transformed_vertex              
-                if transformed_vertex[1] <= self.min_vertex_y[1]:
-                    self.min_vertex_y = transformed_vertex           
-                if transformed_vertex[2] <= self.min_vertex_z[2]:
-                    self.min_vertex_z = transformed_vertex
-        
+
+            # Apply the object's transformation to the vertices
+            transformed_vertices = (obj_matrix @ mathutils.Vector(v) for v in vertex_data[ob])
+            extremes = update_extreme_vectors(extremes, transformed_vertices)
+
+        if extremes:
+            (self.max_vertex_x, self.max_vertex_y, self.max_vertex_z,
+             self.min_vertex_x, self.min_vertex_y, self.min_vertex_z) = extremes
+
+    def _reduce_bound_vectors_parallel(self, buffers):
+        '''Same as _reduce_bound_vectors, but the objects are processed by a thread pool'''
+
+        if not buffers:
+            return
+
+        extremes = parallel_extreme_vectors(buffers, self.workers)
+
+        (self.max_vertex_x, self.max_vertex_y, self.max_vertex_z,
+         self.min_vertex_x, self.min_vertex_y, self.min_vertex_z) = (mathutils.Vector(v) for v in extremes)
 
     def debug(self, context):
         '''Enable debug mode, when enabled it will display each 
@@ -131,6 +218,8 @@ class BoundBox:
             self, 
             context, 
             objs : list[bpy.types.Object], 
+            workers : int | None = None,
+            parallel_threshold : int | None = None,
             ):
         ''' BoundBox initialization class
 
@@ -138,11 +227,15 @@ class BoundBox:
         :type context: bpy.context
         :param objs: objects to calculate the bound box
         :type objs: list[bpy.types.Object]
+        :param workers: number of threads used to calculate the bound vectors, default to :attr:`BoundVectors.workers`
+        :type workers: int
+        :param parallel_threshold: minimum number of mesh objects to use the threads, default to :attr:`BoundVectors.parallel_threshold`
+        :type parallel_threshold: int
 
         '''
 
         self.objs = objs
-        self.bv = BoundVectors(objs)
+        self.bv = BoundVectors(objs, workers, parallel_threshold)
 
     @staticmethod
     def _object_selection_context(func):
@@ -177,7 +270,8 @@ class BoundBox:
         the current bound box of the object
         
         '''
-        context.view_layer.update()
+        with instrumentation.phase(instrumentation.VIEW_LAYER_UPDATE):
+            context.view_layer.update()
         self.bv.update()
 
 
@@ -268,7 +362,8 @@ class BoundBox:
 
         # Executing
         context.scene.cursor.location = location
-        bpy.ops.object.origin_set(type='ORIGIN_CURSOR') 
+        with instrumentation.phase(instrumentation.OPS_ORIGIN_SET):
+            bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
 
         self._update_vectors(context)
 
@@ -278,7 +373,8 @@ class BoundBox:
         ex: if the factor is 2, the object will be scaled to 2 times it's original size'''
 
         scale = value / factor
-        bpy.ops.transform.resize(value=(scale, scale, scale), orient_type='LOCAL') 
+        with instrumentation.phase(instrumentation.OPS_RESIZE):
+            bpy.ops.transform.resize(value=(scale, scale, scale), orient_type='LOCAL')
 
         self._update_vectors(context)
 
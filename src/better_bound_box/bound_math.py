@@ -0,0 +1,208 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2023 Rodrigo Gama
+
+'''Pure math helpers of the bound box calculations
+
+This module doesn't import bpy, bmesh or mathutils, so it can be used
+(and benchmarked) outside of Blender. The numpy functions work with
+``(n, 3)`` coordinate arrays and ``(4, 4)`` world matrices, numpy releases
+the GIL during this work, so they can run in a thread pool.
+'''
+
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Number of chunks given to each worker, more chunks balance objects with
+# different vertex counts better, but each chunk has its own overhead
+CHUNKS_PER_WORKER = 4
+
+# Thread pool shared by every call, created on first use and rebuilt only
+# when more workers than it has are needed
+_executor : ThreadPoolExecutor | None = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def update_extreme_vectors(extremes : list, points) -> list:
+    '''Update the extreme vectors with the given points and return them.
+
+    *extremes* - list with the current ``max_x, max_y, max_z, min_x, min_y, min_z``
+    points, or an empty list if no point was processed yet
+
+    *points* - iterable of points, each point is indexable by 0, 1 and 2
+
+    When two points have the same coordinate value, the last one is kept.
+    '''
+
+    for point in points:
+
+        if not extremes:
+            extremes = [point] * 6
+
+        if point[0] >= extremes[0][0]:
+            extremes[0] = point
+        if point[1] >= extremes[1][1]:
+            extremes[1] = point
+        if point[2] >= extremes[2][2]:
+            extremes[2] = point
+
+        if point[0] <= extremes[3][0]:
+            extremes[3] = point
+        if point[1] <= extremes[4][1]:
+            extremes[4] = point
+        if point[2] <= extremes[5][2]:
+            extremes[5] = point
+
+    return extremes
+
+
+def transform_extreme_vectors(coords : np.ndarray, matrix : np.ndarray) -> np.ndarray:
+    '''Transform the coordinates by the world matrix and get the extreme vectors
+
+    *coords* - ``(n, 3)`` array of local coordinates, n must be greater than 0
+
+    *matrix* - ``(4, 4)`` world matrix
+
+    Returns a ``(6, 3)`` array with the ``max_x, max_y, max_z, min_x, min_y, min_z``
+    points. As in :func:`update_extreme_vectors`, the last point is kept on ties.
+    '''
+
+    points = coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+    # argmax and argmin return the first index, search the reversed
+    # points to keep the last one
+    last = len(points) - 1
+    reversed_points = points[::-1]
+    indices = np.concatenate((
+        last - reversed_points.argmax(axis=0),
+        last - reversed_points.argmin(axis=0),
+    ))
+
+    return points[indices]
+
+
+def merge_extreme_vectors(first : np.ndarray, second : np.ndarray) -> np.ndarray:
+    '''Merge the extreme vectors of two groups of points, *second* being
+    the group processed after *first* (it's kept on ties)'''
+
+    axes = np.arange(3)
+    merged = first.copy()
+
+    take_max = second[axes, axes] >= first[axes, axes]
+    take_min = second[axes + 3, axes] <= first[axes + 3, axes]
+    take = np.concatenate((take_max, take_min))
+    merged[take] = second[take]
+
+    return merged
+
+
+def reduce_extreme_vectors(results : np.ndarray) -> np.ndarray:
+    '''Merge a ``(k, 6, 3)`` array of extreme vectors at once, the later
+    ones are kept on ties'''
+
+    axes = np.arange(3)
+    last = len(results) - 1
+    reversed_results = results[::-1]
+    indices = np.concatenate((
+        last - reversed_results[:, axes, axes].argmax(axis=0),
+        last - reversed_results[:, axes + 3, axes].argmin(axis=0),
+    ))
+
+    return results[indices, np.arange(6)]
+
+
+def tree_reduce_extreme_vectors(results : list[np.ndarray]) -> np.ndarray:
+    '''Merge a list of extreme vectors in pairs until only one is left,
+    keeping the order of the list'''
+
+    while len(results) > 1:
+        merged = [
+            merge_extreme_vectors(results[index], results[index + 1])
+            for index in range(0, len(results) - 1, 2)
+        ]
+        if len(results) % 2:
+            merged.append(results[-1])
+        results = merged
+
+    return results[0]
+
+
+def _reduce_chunk(buffers : list[tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+    '''Get the extreme vectors of a chunk of (coords, matrix) buffers'''
+
+    return reduce_extreme_vectors(np.stack([
+        transform_extreme_vectors(coords, matrix) for coords, matrix in buffers
+    ]))
+
+
+def _reduce_chunks(chunks : list[list[tuple[np.ndarray, np.ndarray]]]) -> list[np.ndarray]:
+    '''Get the extreme vectors of each chunk, one worker task'''
+
+    return [_reduce_chunk(chunk) for chunk in chunks]
+
+
+def _get_executor(workers : int) -> ThreadPoolExecutor:
+    '''Get the shared thread pool with at least the given number of workers'''
+
+    global _executor, _executor_workers
+
+    with _executor_lock:
+        if _executor is None or _executor_workers < workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="better_bound_box")
+            _executor_workers = workers
+
+        return _executor
+
+
+def shutdown_executor() -> None:
+    '''Shut down the shared thread pool, it's created again by the next
+    parallel call. Call it when the addon is unregistered'''
+
+    global _executor, _executor_workers
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+        _executor = None
+        _executor_workers = 0
+
+
+def parallel_extreme_vectors(buffers : list[tuple[np.ndarray, np.ndarray]], workers : int) -> np.ndarray:
+    '''Get the extreme vectors of all the (coords, matrix) buffers using a thread pool
+
+    *buffers* - list of ``(coords, matrix)`` tuples, one for each object, each coords
+    array must have at least one point
+
+    *workers* - number of threads of the pool, with 1 (or less) the chunks are
+    processed in the calling thread
+
+    The buffers are split in ordered chunks, each chunk is reduced by a worker and
+    the chunk results are merged in a tree reduction, so the result is the same
+    as processing the buffers serially. Returns a ``(0, 3)`` array if there are
+    no buffers.
+    '''
+
+    if not buffers:
+        return np.empty((0, 3))
+
+    workers = max(1, workers)
+
+    chunk_size = max(1, -(-len(buffers) // (workers * CHUNKS_PER_WORKER)))
+    chunks = [buffers[index:index + chunk_size] for index in range(0, len(buffers), chunk_size)]
+
+    if workers == 1:
+        results = _reduce_chunks(chunks)
+    else:
+        # The pool can have more threads than workers, so only *workers* tasks
+        # are submitted, each one with every workers-th chunk
+        results = [None] * len(chunks)
+        tasks = [chunks[start::workers] for start in range(workers)]
+        for start, task_results in enumerate(_get_executor(workers).map(_reduce_chunks, tasks)):
+            results[start::workers] = task_results
+
+    return tree_reduce_extreme_vectors(results)
@@ -0,0 +1,205 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2023 Rodrigo Gama
+
+'''Instrumentation module for the better_bound_box addon
+
+This module records how long each phase of a bound box operation takes and
+keeps a set of counters (vertices, objects, rescans...). Nothing is recorded
+until at least one sink is registered with :func:`add_sink`, so when it is
+disabled every call is reduced to a single empty list check.
+
+:class Sink: base class of every sink, it receives phase timings and counters
+
+:class LogSink: writes every phase and counter to a :mod:`logging` logger
+
+:class StatsSink: keeps aggregated phase timings and counters in memory
+
+:class JsonSink: a StatsSink that can export its stats to a json file
+
+'''
+
+import json
+import logging
+import time
+
+from contextlib import nullcontext
+
+# Phase names
+
+EXTRACT = "bound_vectors.extract"
+TRANSFORM = "bound_vectors.transform"
+VIEW_LAYER_UPDATE = "bound_box.view_layer_update"
+OPS_ORIGIN_SET = "bound_box.ops.origin_set"
+OPS_RESIZE = "bound_box.ops.resize"
+
+# Counter names
+
+OBJECTS = "objects"
+MESH_OBJECTS = "mesh_objects"
+VERTICES = "vertices"
+RESCANS = "full_rescans"
+CACHE_HITS = "mesh_cache_hits"
+CACHE_MISSES = "mesh_cache_misses"
+
+
+class Sink:
+    '''Base class of the instrumentation sinks, subclasses should override
+    the methods of the records they are interested in'''
+
+    def record_phase(self, name : str, seconds : float) -> None:
+        '''Receive the wall time in seconds of a finished phase'''
+
+    def record_count(self, name : str, value : int) -> None:
+        '''Receive an increment of the given counter'''
+
+
+class LogSink(Sink):
+    '''Write every record to a logger, useful to follow an operation
+    in the Blender console'''
+
+    def __init__(self, logger : logging.Logger | None = None, level : int = logging.DEBUG):
+
+        self.logger = logger or logging.getLogger("better_bound_box")
+        self.level = level
+
+    def record_phase(self, name, seconds):
+        self.logger.log(self.level, "%s: %.6fs", name, seconds)
+
+    def record_count(self, name, value):
+        self.logger.log(self.level, "%s: +%d", name, value)
+
+
+class StatsSink(Sink):
+    '''Keep aggregated phase timings and counters in memory
+
+    *phases* - dict of phase name to a dict with the ``calls``, ``total``,
+    ``min`` and ``max`` wall time in seconds
+
+    *counters* - dict of counter name to its accumulated value
+
+    '''
+
+    phases : dict[str, dict[str, float]]
+    counters : dict[str, int]
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        '''Clear all the recorded stats'''
+
+        self.phases = {}
+        self.counters = {}
+
+    def record_phase(self, name, seconds):
+
+        stats = self.phases.get(name)
+        if stats is None:
+            self.phases[name] = {"calls": 1, "total": seconds, "min": seconds, "max": seconds}
+            return
+
+        stats["calls"] += 1
+        stats["total"] += seconds
+        stats["min"] = min(stats["min"], seconds)
+        stats["max"] = max(stats["max"], seconds)
+
+    def record_count(self, name, value):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def as_dict(self) -> dict:
+        '''Get a copy of the recorded stats'''
+
+        return {
+            "phases": {name: dict(stats) for name, stats in self.phases.items()},
+            "counters": dict(self.counters),
+        }
+
+
+class JsonSink(StatsSink):
+    '''Same as the StatsSink, but the recorded stats can be exported
+    to a json file with the :meth:`export` method'''
+
+    def __init__(self, path : str):
+
+        super().__init__()
+        self.path = path
+
+    def export(self) -> None:
+        '''Write the recorded stats to the json file'''
+
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(self.as_dict(), file, indent=4)
+
+
+class _Phase:
+    '''Context manager that measures the wall time of a phase'''
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        for sink in _sinks:
+            sink.record_phase(self.name, seconds)
+
+
+_sinks : list[Sink] = []
+_null_phase = nullcontext()
+
+
+def add_sink(sink : Sink) -> Sink:
+    '''Register a sink, the instrumentation is enabled while at least
+    one sink is registered'''
+
+    if sink not in _sinks:
+        _sinks.append(sink)
+    return sink
+
+
+def remove_sink(sink : Sink) -> None:
+    '''Unregister a sink'''
+
+    if sink in _sinks:
+        _sinks.remove(sink)
+
+
+def clear_sinks() -> None:
+    '''Unregister all the sinks, disabling the instrumentation'''
+
+    _sinks.clear()
+
+
+def is_enabled() -> bool:
+    '''Check if there is any sink registered'''
+
+    return bool(_sinks)
+
+
+def phase(name : str):
+    '''Measure the wall time of the code inside the with block
+
+    .. code-block:: python
+
+        with instrumentation.phase(instrumentation.EXTRACT):
+            ...
+
+    '''
+
+    if not _sinks:
+        return _null_phase
+    return _Phase(name)
+
+
+def count(name : str, value : int = 1) -> None:
+    '''Increment the given counter'''
+
+    if not _sinks:
+        return
+    for sink in _sinks:
+        sink.record_count(name, value)
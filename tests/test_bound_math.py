@@ -0,0 +1,127 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2023 Rodrigo Gama
+
+'''Tests of the bpy-free bound_math module
+
+The module is loaded from its file path, because importing the
+better_bound_box package imports bpy.
+'''
+
+import importlib.util
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+BOUND_MATH_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "src", "better_bound_box", "bound_math.py")
+
+spec = importlib.util.spec_from_file_location("bound_math", BOUND_MATH_PATH)
+bound_math = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bound_math)
+
+
+def tied_buffers(rng, objects):
+    '''Generate (coords, matrix) buffers with integer coordinates, so there
+    are a lot of points with the same coordinate value'''
+
+    buffers = []
+    for _ in range(objects):
+        coords = rng.integers(-3, 4, size=(rng.integers(1, 20), 3)).astype(np.float64)
+        matrix = np.identity(4)
+        matrix[:3, 3] = rng.integers(-2, 3, size=3)
+        buffers.append((coords, matrix))
+
+    return buffers
+
+
+def serial_extreme_vectors(buffers):
+    '''Get the extreme vectors of the buffers with update_extreme_vectors'''
+
+    extremes = []
+    for coords, matrix in buffers:
+        points = coords @ matrix[:3, :3].T + matrix[:3, 3]
+        extremes = bound_math.update_extreme_vectors(extremes, [tuple(point) for point in points])
+
+    return np.array(extremes)
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 7])
+def test_parallel_extreme_vectors_keeps_last_point_on_ties(workers):
+
+    rng = np.random.default_rng(workers)
+    for _ in range(100):
+        buffers = tied_buffers(rng, rng.integers(1, 60))
+        result = bound_math.parallel_extreme_vectors(buffers, workers)
+        assert np.array_equal(result, serial_extreme_vectors(buffers))
+
+
+def test_merge_extreme_vectors_keeps_second_on_ties():
+
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        first, second = tied_buffers(rng, 2)
+        merged = bound_math.merge_extreme_vectors(
+            bound_math.transform_extreme_vectors(*first),
+            bound_math.transform_extreme_vectors(*second))
+        assert np.array_equal(merged, serial_extreme_vectors([first, second]))
+
+
+def test_transform_extreme_vectors_applies_matrix():
+
+    coords = np.array([[1.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 0.0, 3.0]])
+    matrix = np.array([
+        [0.0, -1.0, 0.0, 10.0],
+        [1.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ])
+
+    result = bound_math.transform_extreme_vectors(coords, matrix)
+
+    assert np.array_equal(result[0], [10.0, 0.0, 3.0])
+    assert np.array_equal(result[1], [10.0, 1.0, 0.0])
+    assert np.array_equal(result[3], [8.0, 0.0, 0.0])
+
+
+def test_parallel_extreme_vectors_empty_buffers():
+
+    assert bound_math.parallel_extreme_vectors([], 4).shape == (0, 3)
+
+
+def test_parallel_extreme_vectors_clamps_workers():
+
+    buffers = tied_buffers(np.random.default_rng(0), 10)
+    result = bound_math.parallel_extreme_vectors(buffers, 0)
+    assert np.array_equal(result, serial_extreme_vectors(buffers))
+
+
+def test_executor_is_shared_and_grows_to_the_largest_workers():
+
+    bound_math.shutdown_executor()
+    buffers = tied_buffers(np.random.default_rng(0), 40)
+    expected = serial_extreme_vectors(buffers)
+
+    assert np.array_equal(bound_math.parallel_extreme_vectors(buffers, 4), expected)
+    executor = bound_math._executor
+
+    assert np.array_equal(bound_math.parallel_extreme_vectors(buffers, 2), expected)
+    assert bound_math._executor is executor
+
+    assert np.array_equal(bound_math.parallel_extreme_vectors(buffers, 6), expected)
+    assert bound_math._executor is not executor
+    assert bound_math._executor_workers == 6
+
+
+def test_shutdown_executor():
+
+    bound_math.parallel_extreme_vectors(tied_buffers(np.random.default_rng(0), 10), 3)
+    executor = bound_math._executor
+
+    bound_math.shutdown_executor()
+    assert bound_math._executor is None
+    assert executor._shutdown
+
+    bound_math.shutdown_executor()
@@ -0,0 +1,123 @@
+# :coding: utf-8
+# :copyright: Copyright (c) 2023 Rodrigo Gama
+
+'''Tests of the bpy-free instrumentation module
+
+The module is loaded from its file path, because importing the
+better_bound_box package imports bpy.
+'''
+
+import importlib.util
+import json
+import logging
+import os
+
+import pytest
+
+INSTRUMENTATION_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "src", "better_bound_box", "instrumentation.py")
+
+spec = importlib.util.spec_from_file_location("instrumentation", INSTRUMENTATION_PATH)
+instrumentation = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(instrumentation)
+
+
+@pytest.fixture(autouse=True)
+def no_sinks():
+    instrumentation.clear_sinks()
+    yield
+    instrumentation.clear_sinks()
+
+
+class RecordingSink(instrumentation.Sink):
+
+    def __init__(self):
+        self.records = []
+
+    def record_phase(self, name, seconds):
+        self.records.append(("phase", name))
+
+    def record_count(self, name, value):
+        self.records.append(("count", name, value))
+
+
+def test_disabled_without_sinks():
+
+    assert not instrumentation.is_enabled()
+    assert instrumentation.phase(instrumentation.EXTRACT) is instrumentation._null_phase
+
+    sink = RecordingSink()
+    instrumentation.add_sink(sink)
+    instrumentation.remove_sink(sink)
+
+    with instrumentation.phase(instrumentation.EXTRACT):
+        pass
+    instrumentation.count(instrumentation.VERTICES, 10)
+
+    assert sink.records == []
+
+
+def test_stats_sink_aggregates_phases_and_counters():
+
+    stats = instrumentation.add_sink(instrumentation.StatsSink())
+
+    for seconds in (1.0, 3.0, 2.0):
+        stats.record_phase(instrumentation.EXTRACT, seconds)
+    instrumentation.count(instrumentation.VERTICES, 8)
+    instrumentation.count(instrumentation.VERTICES, 4)
+    instrumentation.count(instrumentation.RESCANS)
+
+    assert stats.as_dict() == {
+        "phases": {instrumentation.EXTRACT: {"calls": 3, "total": 6.0, "min": 1.0, "max": 3.0}},
+        "counters": {instrumentation.VERTICES: 12, instrumentation.RESCANS: 1},
+    }
+
+    with instrumentation.phase(instrumentation.TRANSFORM):
+        pass
+    assert stats.phases[instrumentation.TRANSFORM]["calls"] == 1
+
+    stats.reset()
+    assert stats.as_dict() == {"phases": {}, "counters": {}}
+
+
+def test_add_sink_ignores_duplicates():
+
+    sink = RecordingSink()
+    assert instrumentation.add_sink(sink) is sink
+    instrumentation.add_sink(sink)
+
+    instrumentation.count(instrumentation.OBJECTS)
+    assert sink.records == [("count", instrumentation.OBJECTS, 1)]
+
+    instrumentation.remove_sink(sink)
+    instrumentation.remove_sink(sink)
+    assert not instrumentation.is_enabled()
+
+
+def test_json_sink_export(tmp_path):
+
+    path = tmp_path / "stats.json"
+    sink = instrumentation.add_sink(instrumentation.JsonSink(str(path)))
+
+    with instrumentation.phase(instrumentation.TRANSFORM):
+        pass
+    instrumentation.count(instrumentation.MESH_OBJECTS, 2)
+    sink.export()
+
+    with open(path, encoding="utf-8") as file:
+        assert json.load(file) == sink.as_dict()
+
+
+def test_log_sink(caplog):
+
+    instrumentation.add_sink(instrumentation.LogSink(level=logging.INFO))
+
+    with caplog.at_level(logging.INFO, logger="better_bound_box"):
+        with instrumentation.phase(instrumentation.VIEW_LAYER_UPDATE):
+            pass
+        instrumentation.count(instrumentation.VERTICES, 5)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages[0].startswith(f"{instrumentation.VIEW_LAYER_UPDATE}: ")
+    assert messages[1] == f"{instrumentation.VERTICES}: +5"